@@ -1,6 +1,6 @@
 """FastAPI review API for plays and decisions."""
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Optional, Dict, Any
 import logging
 
@@ -9,7 +9,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Spotify Stop AI - Review API",
     description="API for reviewing plays, decisions, and managing artist overrides",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -54,7 +55,7 @@ def create_api(database, classifier):
         """
         try:
             plays = await database.get_plays(limit=limit, offset=offset)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "plays": plays,
                 "count": len(plays),
                 "limit": limit,
@@ -80,7 +81,7 @@ def create_api(database, classifier):
         """
         try:
             decisions = await database.get_decisions(limit=limit, offset=offset)
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "decisions": decisions,
                 "count": len(decisions),
                 "limit": limit,
@@ -105,7 +106,7 @@ def create_api(database, classifier):
                 rows = await cursor.fetchall()
                 overrides = [dict(row) for row in rows]
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "overrides": overrides,
                 "count": len(overrides)
             })
@@ -126,7 +127,7 @@ def create_api(database, classifier):
         try:
             override = await database.get_override(artist_id)
             if override:
-                return JSONResponse(content=override)
+                return ORJSONResponse(content=override)
             else:
                 raise HTTPException(status_code=404, detail="Override not found")
         except HTTPException:
@@ -157,7 +158,7 @@ def create_api(database, classifier):
                 f"Set override for artist {artist_id}: "
                 f"is_artificial={is_artificial}, reason={reason}"
             )
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "message": "Override set successfully",
                 "artist_id": artist_id,
                 "is_artificial": is_artificial,
@@ -180,7 +181,7 @@ def create_api(database, classifier):
         try:
             await database.delete_override(artist_id)
             logger.info(f"Deleted override for artist {artist_id}")
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "message": "Override deleted successfully",
                 "artist_id": artist_id
             })
@@ -222,7 +223,7 @@ def create_api(database, classifier):
             # Get override
             override = await database.get_override(artist_id)
             
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "artist": artist,
                 "decisions": decisions,
                 "override": override
@@ -246,7 +247,7 @@ def create_api(database, classifier):
         """
         try:
             decision = await classifier.classify_artist(artist_id, artist_name)
-            return JSONResponse(content=decision)
+            return ORJSONResponse(content=decision)
         except Exception as e:
             logger.error(f"Failed to classify artist: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -266,4 +267,5 @@ def run_api(database, classifier, host: str = "127.0.0.1", port: int = 8889):
     import uvicorn
     
     api = create_api(database, classifier)
-    uvicorn.run(api, host=host, port=port, log_level="info")
+    uvicorn.run(api, host=host, port=port, log_level="info",
+                loop="uvloop", http="httptools", access_log=False)
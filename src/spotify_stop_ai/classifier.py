@@ -1,4 +1,5 @@
 """Artist classification aggregator with multi-source agreement."""
+import asyncio
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -63,13 +64,23 @@ class ArtistClassifier:
             try:
                 from pathlib import Path
                 # Prompt file is at project root, not in src package
-                prompt_path = Path(__file__).parent.parent.parent / "prompts" / "classify_artist.txt"
-                self.ollama_client = OllamaClient(config["ollama"], str(prompt_path))
+                prompts_dir = Path(__file__).parent.parent.parent / "prompts"
+                self.ollama_client = OllamaClient(
+                    config["ollama"],
+                    str(prompts_dir / "classify_artist.txt"),
+                    str(prompts_dir / "classify_artist_batch.txt")
+                )
                 logger.info(f"Ollama LLM fallback enabled with model {config['ollama'].get('model', 'unknown')}")
             except Exception as e:
                 logger.warning(f"Failed to initialize Ollama client: {e}")
                 import traceback
                 logger.debug(traceback.format_exc())
+
+        # Micro-batch concurrent LLM fallbacks into single model calls
+        self._llm_batch_size = config.get("ollama", {}).get("batch_size", 5)
+        self._llm_batch_window = config.get("ollama", {}).get("batch_window_ms", 250) / 1000.0
+        self._llm_queue: List[tuple] = []
+        self._llm_flush_task: Optional[asyncio.Task] = None
     
     async def classify_artist(self, artist_id: str, artist_name: str,
                              track_name: Optional[str] = None) -> Dict[str, Any]:
@@ -212,7 +223,7 @@ class ArtistClassifier:
             if self.ollama_client:
                 logger.info(f"Inconclusive result for {artist_name}, trying LLM fallback...")
                 try:
-                    llm_result = await self.ollama_client.classify(artist_name, source_results)
+                    llm_result = await self._classify_via_llm(artist_name, source_results)
                     if llm_result and llm_result.get("output"):
                         llm_used = True
                         llm_fallback = llm_result
@@ -284,6 +295,56 @@ class ArtistClassifier:
             "cached_until": cached_until
         }
     
+    async def _classify_via_llm(self, artist_name: str,
+                                evidence: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Queue an LLM classification, batching concurrent requests.
+
+        Requests arriving within the batch window (or before the queue
+        reaches batch_size) are sent to Ollama as one classify_batch call,
+        amortizing model load and prompt preamble over the batch.
+
+        Args:
+            artist_name: Artist name
+            evidence: Source results for the artist
+
+        Returns:
+            LLM classification result dict or None
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._llm_queue.append((artist_name, evidence, future))
+
+        if len(self._llm_queue) >= self._llm_batch_size:
+            await self._flush_llm_queue()
+        elif self._llm_flush_task is None or self._llm_flush_task.done():
+            self._llm_flush_task = asyncio.create_task(self._delayed_llm_flush())
+
+        return await future
+
+    async def _delayed_llm_flush(self) -> None:
+        """Flush the LLM queue after the batch window elapses."""
+        await asyncio.sleep(self._llm_batch_window)
+        await self._flush_llm_queue()
+
+    async def _flush_llm_queue(self) -> None:
+        """Dispatch all queued LLM classifications in one batch call."""
+        batch, self._llm_queue = self._llm_queue, []
+        if not batch:
+            return
+
+        try:
+            results = await self.ollama_client.classify_batch(
+                [(name, evidence) for name, evidence, _ in batch]
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
     async def _store_decision(self, decision: Dict[str, Any]) -> None:
         """Store decision in database.
         
@@ -1,12 +1,109 @@
 """Database schema and operations for Spotify Stop AI."""
 import aiosqlite
+import asyncio
 import logging
+import orjson
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Stay under SQLite's default 999 bound-parameter limit when building
+# IN (...) lists for batched lookups
+_MAX_BATCH_PARAMS = 900
+
+# Hot-path query texts, hoisted to module scope with the seek/offset
+# variants spelled out, so every call passes byte-identical SQL and hits
+# the connection's prepared-statement cache instead of re-parsing
+# Project only the columns the list views and JSON API actually render;
+# SELECT p.* dragged every column (device ids, context uris, progress)
+# across the aiosqlite thread boundary per row, and the album/context
+# joins fed columns nothing displayed
+_PLAYS_SELECT = """
+    SELECT p.id, p.timestamp, t.name as track_name,
+           ar.name as artist_name, ar.id as artist_id
+    FROM plays p
+    LEFT JOIN tracks t ON p.track_id = t.id
+    LEFT JOIN track_artists ta ON p.track_id = ta.track_id AND ta.position = 0
+    LEFT JOIN artists ar ON ta.artist_id = ar.id
+"""
+_PLAYS_ORDER = " ORDER BY p.timestamp DESC, p.id DESC LIMIT ?"
+_Q_PLAYS_RECENT = _PLAYS_SELECT + _PLAYS_ORDER + " OFFSET ?"
+_Q_PLAYS_SEEK = _PLAYS_SELECT + " WHERE (p.timestamp, p.id) < (?, ?)" + _PLAYS_ORDER
+
+_DECISIONS_SELECT = """
+    SELECT d.id, d.artist_id, d.timestamp, d.label, d.is_artificial,
+           d.confidence, d.context_count,
+           d.decision_reason as reason, a.name as artist_name
+    FROM decisions d
+    LEFT JOIN artists a ON d.artist_id = a.id
+"""
+_DECISIONS_ORDER = " ORDER BY d.timestamp DESC, d.id DESC LIMIT ?"
+_Q_DECISIONS_RECENT = _DECISIONS_SELECT + _DECISIONS_ORDER + " OFFSET ?"
+_Q_DECISIONS_SEEK = (_DECISIONS_SELECT
+                     + " WHERE (d.timestamp, d.id) < (?, ?)" + _DECISIONS_ORDER)
+_Q_DECISIONS_FILTERED = (_DECISIONS_SELECT
+                         + " WHERE d.is_artificial = ?" + _DECISIONS_ORDER + " OFFSET ?")
+_Q_DECISIONS_FILTERED_SEEK = (
+    _DECISIONS_SELECT
+    + " WHERE d.is_artificial = ? AND (d.timestamp, d.id) < (?, ?)" + _DECISIONS_ORDER)
+
+_SEARCH_PLAYS_SELECT = """
+    SELECT p.id, p.timestamp, ar.name as artist_name, ar.id as artist_id,
+           t.name as track_name
+    FROM track_search s
+    JOIN plays p ON p.track_id = s.track_id
+    JOIN tracks t ON p.track_id = t.id
+    JOIN track_artists ta ON p.track_id = ta.track_id AND ta.position = 0
+    JOIN artists ar ON ta.artist_id = ar.id
+    WHERE track_search MATCH ?
+"""
+_Q_SEARCH_PLAYS = _SEARCH_PLAYS_SELECT + _PLAYS_ORDER + " OFFSET ?"
+_Q_SEARCH_PLAYS_SEEK = (_SEARCH_PLAYS_SELECT
+                        + " AND (p.timestamp, p.id) < (?, ?)" + _PLAYS_ORDER)
+
+
+# Compiled once; the tokenizer runs on every search keystroke-driven
+# request. Token count is capped so pasted junk can't explode into a
+# huge MATCH expression of prefix terms
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
+_SEARCH_MAX_TOKENS = 8
+
+
+def _fts_match_expr(search: str) -> str:
+    """Turn free-form search text into a prefix-match FTS5 expression.
+
+    Each whitespace/punctuation-separated token becomes a quoted prefix
+    term, so user input can't inject FTS query syntax.
+    """
+    tokens = _SEARCH_TOKEN_RE.findall(search)[:_SEARCH_MAX_TOKENS]
+    return " ".join(f'"{token}"*' for token in tokens)
+
+_Q_PLAYS_FOR_ARTIST = """
+    SELECT p.id, p.timestamp, t.name as track_name
+    FROM plays p
+    JOIN tracks t ON p.track_id = t.id
+    JOIN track_artists ta ON p.track_id = ta.track_id
+    WHERE ta.artist_id = ?
+    ORDER BY p.timestamp DESC
+    LIMIT ?
+"""
+
+# Artist row and override row for the detail page in one statement: both
+# are single-row point lookups, so a tagged UNION ALL halves the
+# round trips through aiosqlite's worker thread
+_Q_ARTIST_AND_OVERRIDE = """
+    SELECT 'artist' as kind, id, name, NULL as is_artificial,
+           NULL as reason, NULL as timestamp
+    FROM artists WHERE id = ?1
+    UNION ALL
+    SELECT 'override', artist_id, NULL, is_artificial, reason, timestamp
+    FROM overrides WHERE artist_id = ?1
+"""
+
 
 class Database:
     """SQLite database manager for tracking plays and decisions."""
@@ -19,10 +116,61 @@ class Database:
         """
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        
+        self.db: Optional[aiosqlite.Connection] = None
+
+        # Read-only connection pool; populated in initialize()
+        self._reader_count = 4
+        self._reader_conns: List[aiosqlite.Connection] = []
+        self._readers: Optional[asyncio.Queue] = None
+
+    @asynccontextmanager
+    async def _connection(self):
+        """Yield the shared writer connection, open for the app lifetime."""
+        yield self.db
+
+    @asynccontextmanager
+    async def reader(self):
+        """Check a read-only connection out of the pool.
+
+        WAL permits many simultaneous readers, but each aiosqlite
+        connection runs one query at a time on its own thread, so reads
+        sharing the writer connection would serialize behind each other.
+        A small pool lets concurrent page loads proceed in parallel.
+        """
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+
+    async def close(self):
+        """Close the writer and pooled reader connections."""
+        if self.db:
+            await self.db.close()
+            self.db = None
+        for reader in self._reader_conns:
+            await reader.close()
+        self._reader_conns = []
+        self._readers = None
+
     async def initialize(self):
-        """Create database schema if not exists."""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Open the shared connection and create the schema if needed."""
+        # One connection for the app lifetime: a per-call connect() spawns a
+        # fresh worker thread and renegotiates PRAGMAs, which dominates the
+        # cost of the web UI's small queries
+        self.db = await aiosqlite.connect(self.db_path, cached_statements=256)
+        self.db.row_factory = aiosqlite.Row
+
+        # WAL lets readers proceed while a write is in flight, and NORMAL
+        # synchronous is durable under WAL; keep temp structures and a
+        # generous page cache in memory, with the file mmap'd for reads
+        await self.db.execute("PRAGMA journal_mode=WAL")
+        await self.db.execute("PRAGMA synchronous=NORMAL")
+        await self.db.execute("PRAGMA temp_store=MEMORY")
+        await self.db.execute("PRAGMA cache_size=-64000")
+        await self.db.execute("PRAGMA mmap_size=268435456")
+
+        async with self._connection() as db:
             # Artists table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS artists (
@@ -121,6 +269,7 @@ class Database:
                     llm_used INTEGER DEFAULT 0,
                     decision_reason TEXT,
                     cached_until TEXT,
+                    context_count INTEGER NOT NULL DEFAULT 0,
                     FOREIGN KEY (artist_id) REFERENCES artists(id)
                 )
             """)
@@ -186,14 +335,129 @@ class Database:
             await db.execute("CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions(timestamp)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_sources_decision ON sources(decision_id)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_actions_play ON actions(play_id)")
-            
+            # Composite indexes backing keyset pagination on the listing pages
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_plays_ts_id ON plays(timestamp DESC, id DESC)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_decisions_ts_id ON decisions(timestamp DESC, id DESC)")
+            # Composite indexes for the artist detail page: decisions for an
+            # artist come back newest-first without a sort step, and the
+            # plays-for-artist join is satisfied from the indexes alone
+            # (track_artists probe plus a covering plays scan) instead of a
+            # table fetch per matched row
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_decisions_artist_ts ON decisions(artist_id, timestamp DESC)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_track_artists_artist ON track_artists(artist_id, track_id)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_plays_track_ts ON plays(track_id, timestamp DESC, id)")
+
+            # Full-text index over primary-artist and track names, so the
+            # plays search is a token lookup instead of a LIKE '%x%' scan.
+            # Maintained by triggers as tracks are linked or names change
+            await db.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS track_search USING fts5(
+                    track_id UNINDEXED,
+                    artist_name,
+                    track_name,
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_track_search_link
+                AFTER INSERT ON track_artists WHEN NEW.position = 0
+                BEGIN
+                    DELETE FROM track_search WHERE track_id = NEW.track_id;
+                    INSERT INTO track_search (track_id, artist_name, track_name)
+                    VALUES (
+                        NEW.track_id,
+                        (SELECT name FROM artists WHERE id = NEW.artist_id),
+                        (SELECT name FROM tracks WHERE id = NEW.track_id)
+                    );
+                END
+            """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_track_search_artist_rename
+                AFTER UPDATE OF name ON artists WHEN OLD.name != NEW.name
+                BEGIN
+                    UPDATE track_search SET artist_name = NEW.name
+                    WHERE track_id IN (
+                        SELECT track_id FROM track_artists
+                        WHERE artist_id = NEW.id AND position = 0
+                    );
+                END
+            """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_track_search_track_rename
+                AFTER UPDATE OF name ON tracks WHEN OLD.name != NEW.name
+                BEGIN
+                    UPDATE track_search SET track_name = NEW.name
+                    WHERE track_id = NEW.id;
+                END
+            """)
+            # Denormalized per-decision source count, maintained by triggers:
+            # the UI reads it on every refresh while sources are written
+            # once per classification, so trade a little write cost for
+            # join-free reads. Older databases get the column added here
+            async with db.execute("PRAGMA table_info(decisions)") as cursor:
+                columns = [row[1] for row in await cursor.fetchall()]
+            if "context_count" not in columns:
+                await db.execute(
+                    "ALTER TABLE decisions ADD COLUMN context_count INTEGER NOT NULL DEFAULT 0")
+                await db.execute("""
+                    UPDATE decisions SET context_count = (
+                        SELECT COUNT(*) FROM sources
+                        WHERE sources.decision_id = decisions.id
+                    )
+                """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_sources_count_insert
+                AFTER INSERT ON sources
+                BEGIN
+                    UPDATE decisions SET context_count = context_count + 1
+                    WHERE id = NEW.decision_id;
+                END
+            """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_sources_count_delete
+                AFTER DELETE ON sources
+                BEGIN
+                    UPDATE decisions SET context_count = context_count - 1
+                    WHERE id = OLD.decision_id;
+                END
+            """)
+
+            # Backfill tracks linked before the index existed
+            await db.execute("""
+                INSERT INTO track_search (track_id, artist_name, track_name)
+                SELECT ta.track_id, ar.name, t.name
+                FROM track_artists ta
+                JOIN artists ar ON ar.id = ta.artist_id
+                JOIN tracks t ON t.id = ta.track_id
+                WHERE ta.position = 0
+                  AND ta.track_id NOT IN (SELECT track_id FROM track_search)
+            """)
+
+            # Refresh planner statistics so the composite indexes above are
+            # actually chosen on databases that grew before they existed
+            await db.execute("ANALYZE")
+
             await db.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+
+        # Open the read-only pool once the schema (and hence the file)
+        # exists; readers skip the write-oriented PRAGMAs
+        self._readers = asyncio.Queue()
+        for _ in range(self._reader_count):
+            reader = await aiosqlite.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, cached_statements=256)
+            reader.row_factory = aiosqlite.Row
+            await reader.execute("PRAGMA temp_store=MEMORY")
+            await reader.execute("PRAGMA cache_size=-16000")
+            await reader.execute("PRAGMA mmap_size=268435456")
+            self._reader_conns.append(reader)
+            self._readers.put_nowait(reader)
+
+        logger.info(f"Database initialized at {self.db_path}")
     
     async def upsert_artist(self, artist_id: str, name: str, uri: str) -> None:
         """Insert or update artist record."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO artists (id, name, uri, first_seen, last_seen, play_count)
                 VALUES (?, ?, ?, ?, ?, 1)
@@ -210,7 +474,7 @@ class Database:
                           is_local: bool) -> None:
         """Insert or update track record."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO tracks (id, name, uri, duration_ms, explicit, popularity,
                                    is_local, first_seen, last_seen, play_count)
@@ -232,7 +496,7 @@ class Database:
                           release_date: Optional[str]) -> None:
         """Insert or update album record."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO albums (id, name, uri, release_date, first_seen)
                 VALUES (?, ?, ?, ?, ?)
@@ -246,7 +510,7 @@ class Database:
     async def link_track_artist(self, track_id: str, artist_id: str,
                                position: int = 0) -> None:
         """Link track to artist."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT OR IGNORE INTO track_artists (track_id, artist_id, position)
                 VALUES (?, ?, ?)
@@ -257,7 +521,7 @@ class Database:
                             owner: Optional[str], href: Optional[str]) -> None:
         """Insert or update context (playlist/album/etc.)."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO contexts (uri, type, name, owner, href, first_seen, last_seen)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -276,7 +540,7 @@ class Database:
                          device_type: Optional[str], progress_ms: int,
                          is_playing: bool) -> None:
         """Insert play record."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO plays (id, timestamp, track_id, album_id, context_uri,
                                   device_id, device_name, device_type, progress_ms, is_playing)
@@ -293,7 +557,7 @@ class Database:
                              cached_until: str) -> None:
         """Insert classification decision."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO decisions (id, artist_id, timestamp, label, is_artificial,
                                       confidence, sources_agreeing, min_required,
@@ -312,7 +576,7 @@ class Database:
                                    signals: Optional[str], url: Optional[str],
                                    query_time_ms: int) -> None:
         """Insert source classification result."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO sources (decision_id, source_name, success, result,
                                     signals, url, query_time_ms)
@@ -326,7 +590,7 @@ class Database:
                                load_duration_ms: int, eval_duration_ms: int,
                                total_duration_ms: int) -> None:
         """Insert LLM output record."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO llm_outputs (decision_id, model, prompt, output,
                                         load_duration_ms, eval_duration_ms,
@@ -341,7 +605,7 @@ class Database:
                            added_to_blocked_playlist: bool) -> None:
         """Insert action record."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO actions (play_id, timestamp, skipped,
                                     removed_from_playlist, added_to_blocked_playlist)
@@ -352,8 +616,7 @@ class Database:
     
     async def get_override(self, artist_id: str) -> Optional[Dict[str, Any]]:
         """Get user override for artist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.reader() as db:
             async with db.execute("""
                 SELECT * FROM overrides WHERE artist_id = ?
             """, (artist_id,)) as cursor:
@@ -366,7 +629,7 @@ class Database:
                           reason: Optional[str]) -> None:
         """Set user override for artist."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 INSERT INTO overrides (artist_id, is_artificial, reason, timestamp)
                 VALUES (?, ?, ?, ?)
@@ -379,7 +642,7 @@ class Database:
     
     async def delete_override(self, artist_id: str) -> None:
         """Delete user override for artist."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("DELETE FROM overrides WHERE artist_id = ?",
                            (artist_id,))
             await db.commit()
@@ -387,8 +650,7 @@ class Database:
     async def get_cached_decision(self, artist_id: str) -> Optional[Dict[str, Any]]:
         """Get cached decision for artist if not expired."""
         now = datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.reader() as db:
             async with db.execute("""
                 SELECT * FROM decisions
                 WHERE artist_id = ? AND cached_until > ?
@@ -401,7 +663,7 @@ class Database:
     
     async def invalidate_cache(self, artist_id: str) -> None:
         """Invalidate cached decisions for an artist by setting cached_until to past."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             await db.execute("""
                 UPDATE decisions 
                 SET cached_until = '2000-01-01T00:00:00'
@@ -409,87 +671,92 @@ class Database:
             """, (artist_id,))
             await db.commit()
     
-    async def get_plays(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get recent plays."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT p.*, t.name as track_name, a.name as album_name,
-                       ar.name as artist_name, ar.id as artist_id,
-                       c.name as context_name, c.type as context_type
-                FROM plays p
-                LEFT JOIN tracks t ON p.track_id = t.id
-                LEFT JOIN albums a ON p.album_id = a.id
-                LEFT JOIN track_artists ta ON p.track_id = ta.track_id AND ta.position = 0
-                LEFT JOIN artists ar ON ta.artist_id = ar.id
-                LEFT JOIN contexts c ON p.context_uri = c.uri
-                ORDER BY p.timestamp DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset)) as cursor:
-                rows = await cursor.fetchall()
+    async def get_plays(self, limit: int = 100, offset: int = 0,
+                       before_ts: Optional[str] = None,
+                       before_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recent plays.
+
+        When a (before_ts, before_id) cursor is given, seek past it instead
+        of using OFFSET, so deep pages stay O(limit) rather than scanning
+        and discarding every earlier row.
+        """
+        if before_ts is not None:
+            query = _Q_PLAYS_SEEK
+            params = (before_ts, before_id, limit)
+        else:
+            query = _Q_PLAYS_RECENT
+            params = (limit, offset)
+        async with self.reader() as db:
+            async with db.execute(query, params) as cursor:
+                # LIMIT bounds the result set; fetch it as one batch
+                rows = await cursor.fetchmany(limit)
                 return [dict(row) for row in rows]
     
-    async def get_decisions(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get recent decisions."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT d.*, a.name as artist_name
-                FROM decisions d
-                LEFT JOIN artists a ON d.artist_id = a.id
-                ORDER BY d.timestamp DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset)) as cursor:
-                rows = await cursor.fetchall()
+    async def get_decisions(self, limit: int = 100, offset: int = 0,
+                           before_ts: Optional[str] = None,
+                           before_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recent decisions.
+
+        Supports the same keyset cursor as get_plays; see there for why.
+        """
+        if before_ts is not None:
+            query = _Q_DECISIONS_SEEK
+            params = (before_ts, before_id, limit)
+        else:
+            query = _Q_DECISIONS_RECENT
+            params = (limit, offset)
+        async with self.reader() as db:
+            async with db.execute(query, params) as cursor:
+                # LIMIT bounds the result set; fetch it as one batch
+                rows = await cursor.fetchmany(limit)
                 return [dict(row) for row in rows]
     
-    async def get_decision_context_count(self, decision_id: int) -> int:
-        """Get count of sources for a decision."""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(
-                "SELECT COUNT(*) as count FROM sources WHERE decision_id = ?",
-                (decision_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
-    
-    async def search_plays(self, search: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
-        """Search plays by artist or track name."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT p.*, ar.name as artist_name, ar.id as artist_id, t.name as track_name
-                FROM plays p
-                JOIN tracks t ON p.track_id = t.id
-                JOIN track_artists ta ON p.track_id = ta.track_id AND ta.position = 0
-                JOIN artists ar ON ta.artist_id = ar.id
-                WHERE ar.name LIKE ? OR t.name LIKE ?
-                ORDER BY p.timestamp DESC
-                LIMIT ? OFFSET ?
-            """, (f"%{search}%", f"%{search}%", limit, offset)) as cursor:
-                rows = await cursor.fetchall()
+    async def get_overrides_for_artists(self, artist_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get overrides for several artists in one query."""
+        if not artist_ids:
+            return {}
+        overrides: Dict[str, Dict[str, Any]] = {}
+        async with self.reader() as db:
+            for start in range(0, len(artist_ids), _MAX_BATCH_PARAMS):
+                chunk = artist_ids[start:start + _MAX_BATCH_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                async with db.execute(f"""
+                    SELECT * FROM overrides WHERE artist_id IN ({placeholders})
+                """, chunk) as cursor:
+                    rows = await cursor.fetchall()
+                    overrides.update({row["artist_id"]: dict(row) for row in rows})
+        return overrides
+
+    async def search_plays(self, search: str, limit: int = 50, offset: int = 0,
+                          before_ts: Optional[str] = None,
+                          before_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search plays by artist or track name (prefix match per word)."""
+        match = _fts_match_expr(search)
+        if not match:
+            return []
+        if before_ts is not None:
+            query = _Q_SEARCH_PLAYS_SEEK
+            params = (match, before_ts, before_id, limit)
+        else:
+            query = _Q_SEARCH_PLAYS
+            params = (match, limit, offset)
+        async with self.reader() as db:
+            async with db.execute(query, params) as cursor:
+                # LIMIT bounds the result set; fetch it as one batch
+                rows = await cursor.fetchmany(limit)
                 return [dict(row) for row in rows]
     
     async def get_plays_for_artist(self, artist_id: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Get plays for a specific artist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT p.*, t.name as track_name
-                FROM plays p
-                JOIN tracks t ON p.track_id = t.id
-                JOIN track_artists ta ON p.track_id = ta.track_id
-                WHERE ta.artist_id = ?
-                ORDER BY p.timestamp DESC
-                LIMIT ?
-            """, (artist_id, limit)) as cursor:
-                rows = await cursor.fetchall()
+        async with self.reader() as db:
+            async with db.execute(_Q_PLAYS_FOR_ARTIST, (artist_id, limit)) as cursor:
+                # LIMIT bounds the result set; fetch it as one batch
+                rows = await cursor.fetchmany(limit)
                 return [dict(row) for row in rows]
     
     async def get_artist(self, artist_id: str) -> Optional[Dict[str, Any]]:
         """Get artist by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.reader() as db:
             async with db.execute(
                 "SELECT * FROM artists WHERE id = ?", (artist_id,)
             ) as cursor:
@@ -498,77 +765,98 @@ class Database:
     
     async def get_decisions_with_sources(self, artist_id: str) -> List[Dict[str, Any]]:
         """Get all decisions for an artist with their sources and LLM outputs."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            # Get decisions with sources
-            async with db.execute("""
-                SELECT d.*, s.source_name, s.result, s.signals, s.url
-                FROM decisions d
-                LEFT JOIN sources s ON d.id = s.decision_id
-                WHERE d.artist_id = ?
-                ORDER BY d.timestamp DESC
-            """, (artist_id,)) as cursor:
-                rows = await cursor.fetchall()
-                
-                # Group sources by decision
-                decisions_map = {}
-                for row in rows:
-                    row_dict = dict(row)
-                    decision_id = row_dict['id']
-                    
-                    if decision_id not in decisions_map:
-                        decisions_map[decision_id] = {
-                            'id': row_dict['id'],
-                            'artist_id': row_dict['artist_id'],
-                            'timestamp': row_dict['timestamp'],
-                            'label': row_dict['label'],
-                            'is_artificial': row_dict['is_artificial'],
-                            'confidence': row_dict['confidence'],
-                            'sources_agreeing': row_dict['sources_agreeing'],
-                            'min_required': row_dict['min_required'],
-                            'band_policy_applied': row_dict['band_policy_applied'],
-                            'llm_used': row_dict['llm_used'],
-                            'decision_reason': row_dict['decision_reason'],
-                            'sources': [],
-                            'llm_output': None
+        async with self.reader() as db:
+            return await self._decisions_with_sources(db, artist_id)
+
+    async def _decisions_with_sources(self, db, artist_id: str) -> List[Dict[str, Any]]:
+        """Decisions-with-sources body, run on an already-checked-out reader."""
+        # Aggregate each decision's sources in SQL: one row per decision
+        # with its sources already packed as JSON, instead of a
+        # decision x source row set grouped by a Python loop
+        async with db.execute("""
+            SELECT d.*,
+                   json_group_array(
+                       json_object(
+                           'source_name', s.source_name,
+                           'result', s.result,
+                           'signals', s.signals,
+                           'url', s.url
+                       )
+                   ) FILTER (WHERE s.source_name IS NOT NULL) as sources_json
+            FROM decisions d
+            LEFT JOIN sources s ON d.id = s.decision_id
+            WHERE d.artist_id = ?
+            GROUP BY d.id
+            ORDER BY d.timestamp DESC
+        """, (artist_id,)) as cursor:
+            rows = await cursor.fetchall()
+
+        decisions = []
+        for row in rows:
+            decision = dict(row)
+            decision['sources'] = orjson.loads(decision.pop('sources_json') or '[]')
+            decision['llm_output'] = None
+            decisions.append(decision)
+
+        # Get LLM outputs for decisions that used LLM
+        for decision in decisions:
+            if decision['llm_used']:
+                async with db.execute("""
+                    SELECT model, prompt, output, load_duration_ms,
+                           eval_duration_ms, total_duration_ms
+                    FROM llm_outputs
+                    WHERE decision_id = ?
+                    ORDER BY id DESC LIMIT 1
+                """, (decision['id'],)) as cursor:
+                    llm_row = await cursor.fetchone()
+                    if llm_row:
+                        decision['llm_output'] = dict(llm_row)
+
+        return decisions
+
+    async def get_artist_detail(self, artist_id: str, plays_limit: int = 20) -> tuple:
+        """Get everything the artist detail page needs on one reader.
+
+        Returns (artist, decisions, override, plays). Holding a single
+        pooled connection for the whole page fetch avoids checking out
+        the reader pool once per query, and the artist and override
+        point lookups share one tagged UNION ALL statement.
+        """
+        async with self.reader() as db:
+            artist = None
+            override = None
+            async with db.execute(_Q_ARTIST_AND_OVERRIDE, (artist_id,)) as cursor:
+                for row in await cursor.fetchall():
+                    if row['kind'] == 'artist':
+                        artist = {'id': row['id'], 'name': row['name']}
+                    else:
+                        override = {
+                            'artist_id': row['id'],
+                            'is_artificial': row['is_artificial'],
+                            'reason': row['reason'],
+                            'timestamp': row['timestamp'],
                         }
-                    
-                    if row_dict['source_name']:
-                        decisions_map[decision_id]['sources'].append({
-                            'source_name': row_dict['source_name'],
-                            'result': row_dict['result'],
-                            'signals': row_dict['signals'],
-                            'url': row_dict['url']
-                        })
-            
-            # Get LLM outputs for decisions that used LLM
-            for decision_id, decision in decisions_map.items():
-                if decision['llm_used']:
-                    async with db.execute("""
-                        SELECT model, prompt, output, load_duration_ms, prompt_eval_count,
-                               eval_count, total_duration_ms
-                        FROM llm_outputs
-                        WHERE decision_id = ?
-                        ORDER BY id DESC LIMIT 1
-                    """, (decision_id,)) as cursor:
-                        llm_row = await cursor.fetchone()
-                        if llm_row:
-                            decision['llm_output'] = dict(llm_row)
-            
-            return list(decisions_map.values())
+            if artist is None:
+                return None, [], None, []
+
+            async with db.execute(_Q_PLAYS_FOR_ARTIST, (artist_id, plays_limit)) as cursor:
+                plays = [dict(row) for row in await cursor.fetchmany(plays_limit)]
+
+            decisions = await self._decisions_with_sources(db, artist_id)
+            return artist, decisions, override, plays
     
-    async def get_decisions_filtered(self, is_artificial: bool, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+    async def get_decisions_filtered(self, is_artificial: bool, limit: int = 50, offset: int = 0,
+                                    before_ts: Optional[str] = None,
+                                    before_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get decisions filtered by artificial status."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT d.*, a.name as artist_name
-                FROM decisions d
-                LEFT JOIN artists a ON d.artist_id = a.id
-                WHERE d.is_artificial = ?
-                ORDER BY d.timestamp DESC
-                LIMIT ? OFFSET ?
-            """, (is_artificial, limit, offset)) as cursor:
-                rows = await cursor.fetchall()
+        if before_ts is not None:
+            query = _Q_DECISIONS_FILTERED_SEEK
+            params = (is_artificial, before_ts, before_id, limit)
+        else:
+            query = _Q_DECISIONS_FILTERED
+            params = (is_artificial, limit, offset)
+        async with self.reader() as db:
+            async with db.execute(query, params) as cursor:
+                # LIMIT bounds the result set; fetch it as one batch
+                rows = await cursor.fetchmany(limit)
                 return [dict(row) for row in rows]
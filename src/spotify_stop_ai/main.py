@@ -1,6 +1,7 @@
 """Main entry point for Spotify Stop AI."""
 import asyncio
 import logging
+import mmap
 import sys
 import os
 from pathlib import Path
@@ -56,8 +57,23 @@ def load_config(config_path: str = "config.yaml") -> dict:
         logger.info("Please copy config.example.yaml to config.yaml and configure it")
         sys.exit(1)
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # Prefer the C loader when PyYAML was built with libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    if os.path.getsize(config_path) > 8192:
+        # Memory-map larger configs so the parser reads straight from the
+        # page cache instead of an extra userspace copy
+        with open(config_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            try:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_WILLNEED)
+                config = yaml.load(mm, Loader=loader)
+            finally:
+                mm.close()
+    else:
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=loader)
     
     # Replace environment variable placeholders
     def replace_env_vars(obj):
@@ -152,7 +168,8 @@ async def main():
         logger.info("Starting review API...")
         api = create_api(database, classifier)
         api_config = uvicorn.Config(
-            api, host=api_host, port=api_port, log_level="error"
+            api, host=api_host, port=api_port, log_level="error",
+            loop="uvloop", http="httptools", access_log=False
         )
         api_server = uvicorn.Server(api_config)
         servers.append(("API", api_server, f"http://{api_host}:{api_port}/docs"))
@@ -161,46 +178,43 @@ async def main():
         logger.info("Starting web UI...")
         web_ui = create_web_ui(database, classifier, spotify_client, monitor)
         web_ui_config = uvicorn.Config(
-            web_ui, host=web_ui_host, port=web_ui_port, log_level="error"
+            web_ui, host=web_ui_host, port=web_ui_port, log_level="error",
+            loop="uvloop", http="httptools", access_log=False
         )
         web_ui_server = uvicorn.Server(web_ui_config)
         servers.append(("Web UI", web_ui_server, f"http://{web_ui_host}:{web_ui_port}"))
         
         # Start all servers concurrently
         async def run_servers():
-            """Run all servers concurrently."""
-            tasks = []
-            for name, server, url in servers:
-                task = asyncio.create_task(server.serve())
-                tasks.append(task)
-            
-            # Wait a moment for servers to start
-            await asyncio.sleep(1)
-            
-            # Print startup banner
-            print("\n" + "="*60)
-            print("🎵 Spotify Stop AI - Running")
-            print("="*60)
-            print(f"📊 Web UI:  http://{web_ui_host}:{web_ui_port}")
-            print(f"🔌 API:     http://{api_host}:{api_port}/docs")
-            print("="*60 + "\n")
-            
-            # Start monitor
-            monitor_task = asyncio.create_task(monitor.start())
-            tasks.append(monitor_task)
-            
-            # Wait for any task to complete (they shouldn't unless there's an error)
-            await asyncio.gather(*tasks, return_exceptions=True)
-        
+            """Run all servers and the monitor under one task group."""
+            async with asyncio.TaskGroup() as tg:
+                for name, server, url in servers:
+                    tg.create_task(server.serve())
+
+                # Wait a moment for servers to start
+                await asyncio.sleep(1)
+
+                # Print startup banner
+                print("\n" + "="*60)
+                print("🎵 Spotify Stop AI - Running")
+                print("="*60)
+                print(f"📊 Web UI:  http://{web_ui_host}:{web_ui_port}")
+                print(f"🔌 API:     http://{api_host}:{api_port}/docs")
+                print("="*60 + "\n")
+
+                tg.create_task(monitor.start())
+
         try:
             await run_servers()
-        except KeyboardInterrupt:
+        except* KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
             await monitor.stop()
-            # Shutdown servers
+            # Signal servers to exit; the task group collects them in parallel
             for name, server, url in servers:
-                await server.shutdown()
+                server.should_exit = True
+            await spotify_client.aclose()
+            await database.close()
             logger.info("Spotify Stop AI stopped")
     else:
         # No API, just run monitor
@@ -210,11 +224,23 @@ async def main():
             logger.info("Received interrupt signal")
         finally:
             await monitor.stop()
+            await spotify_client.aclose()
+            await database.close()
             logger.info("Spotify Stop AI stopped")
 
 
 def cli_main():
     """CLI entry point."""
+    # uvicorn only honors its loop setting in Server.run(); main() drives
+    # the servers via await server.serve(), so the loop asyncio.run creates
+    # here is the one everything runs on — install uvloop for it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        # uvloop ships with uvicorn[standard] except on Windows
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
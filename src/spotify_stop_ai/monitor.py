@@ -1,12 +1,20 @@
 """Playback monitor and action engine."""
 import asyncio
+import hashlib
 import logging
-from datetime import datetime
+import orjson
+from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Optional, Dict, Any, Set
 import time
 
 logger = logging.getLogger(__name__)
 
+# Resolve the always-present track/artist fields in one C-level call
+# instead of separate dict lookups; optional fields still use .get()
+_get_track = itemgetter("id", "name", "uri")
+_get_artist = itemgetter("id", "name", "uri")
+
 
 class PlaybackMonitor:
     """Monitor Spotify playback and take actions on AI artists."""
@@ -36,18 +44,34 @@ class PlaybackMonitor:
         self.current_backoff = self.poll_interval
         self.last_track_id: Optional[str] = None
         self.processed_tracks: Set[str] = set()  # Track IDs processed in this session
+        self._logged_plays: Dict[str, str] = {}  # track_id -> play_id for the current track
+        self._next_poll: Optional[asyncio.Task] = None  # poll overlapped with processing
         self.running = False
         self.blocked_playlist_id: Optional[str] = None
+        self._user_id: Optional[str] = None  # cached at start(); stable for the session
         
         # Track current state for web UI
         self.current_track: Optional[Dict[str, Any]] = None
         self.last_decision: Optional[Dict[str, Any]] = None
+        self._ts_sec = 0  # second the cached display timestamp was formatted for
+        self._ts_iso = ""
+
+        # Pre-encoded /api/current payload; updated here so the endpoint
+        # serves bytes without encoding JSON per request
+        self.current_cached_bytes: Optional[bytes] = None
+        self.current_etag: Optional[str] = None
     
     async def start(self):
         """Start monitoring playback."""
         logger.info("Starting playback monitor...")
         self.running = True
-        
+
+        # Cache the user ID once; it cannot change during a session
+        try:
+            self._user_id = self.spotify.sp.current_user()["id"]
+        except Exception as e:
+            logger.warning(f"Could not fetch current user: {e}")
+
         # Initialize blocked playlist if configured
         if self.blocked_playlist_name:
             await self._ensure_blocked_playlist()
@@ -65,11 +89,19 @@ class PlaybackMonitor:
         """Stop monitoring."""
         logger.info("Stopping playback monitor...")
         self.running = False
+        if self._next_poll is not None:
+            self._next_poll.cancel()
+            self._next_poll = None
     
     async def _monitor_cycle(self):
         """Single monitoring cycle."""
-        # Get current playback
-        playback = self.spotify.get_current_playback()
+        # Get current playback, reusing the poll started at the end of the
+        # previous cycle (if any)
+        if self._next_poll is not None:
+            playback = await self._next_poll
+            self._next_poll = None
+        else:
+            playback = await self.spotify.get_current_playback()
         
         if not playback:
             # Nothing playing or API error
@@ -103,30 +135,60 @@ class PlaybackMonitor:
         artist_id = artist_info.get("id")
         artist_name = artist_info.get("name", "Unknown")
         
-        # Update current track for web UI
+        # Skip if same track as last check. current_track and the cached
+        # /api/current payload already reflect it, so the ETag stays stable
+        # and auto-refresh pollers get 304s until the track changes
+        if track_id == self.last_track_id:
+            return
+
+        # Update current track for web UI; the timestamp marks when the
+        # track was first seen (shown as "Started:") and the display only
+        # has seconds granularity, so re-format it at most once per second
+        now_sec = int(time.time())
+        if now_sec != self._ts_sec:
+            self._ts_sec = now_sec
+            self._ts_iso = datetime.fromtimestamp(now_sec).isoformat()
+
         self.current_track = {
             "track_id": track_id,
             "track_name": track_name,
             "artist_id": artist_id,
             "artist_name": artist_name,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._ts_iso
         }
-        
-        # Skip if same track as last check
-        if track_id == self.last_track_id:
-            return
-        
+        self._update_current_cache()
+
         self.last_track_id = track_id
-        
+        self._logged_plays.clear()
+
         # Skip if already processed in this session
         if track_id in self.processed_tracks:
             return
         
         self.processed_tracks.add(track_id)
-        
+
         # Process track
         await self._process_track(playback, item)
+
+        # Start the next poll only after processing: a poll issued earlier
+        # would snapshot playback before any auto-skip fired and the stale
+        # result would delay detecting the next track by a full cycle.
+        # Issued here it reflects post-skip state and overlaps with the
+        # backoff sleep, so the next cycle skips the HTTP round trip
+        self._next_poll = asyncio.create_task(
+            self.spotify.get_current_playback()
+        )
     
+    def _update_current_cache(self):
+        """Re-encode the /api/current payload off the request path."""
+        self.current_cached_bytes = orjson.dumps({
+            "current_track": self.current_track,
+            "last_decision": self.last_decision
+        }, default=str)
+        self.current_etag = hashlib.blake2b(
+            self.current_cached_bytes, digest_size=8
+        ).hexdigest()
+
     async def _process_track(self, playback: Dict[str, Any], item: Dict[str, Any]):
         """Process a new track.
         
@@ -156,7 +218,8 @@ class PlaybackMonitor:
             artist_id, artist_name, track_name
         )
         self.last_decision = decision  # Store for web UI
-        
+        self._update_current_cache()
+
         logger.info(
             f"Classification: {artist_name} -> {decision['label']} "
             f"(artificial: {decision['is_artificial']}, "
@@ -177,11 +240,14 @@ class PlaybackMonitor:
         Returns:
             Play ID
         """
+        # Reuse the prior play ID if this track was already logged in this
+        # cycle (e.g. a classifier/action retry re-entered _process_track)
+        if (play_id := self._logged_plays.get(item["id"])) is not None:
+            return play_id
+
         try:
             # Extract data
-            track_id = item["id"]
-            track_name = item["name"]
-            track_uri = item["uri"]
+            track_id, track_name, track_uri = _get_track(item)
             duration_ms = item.get("duration_ms", 0)
             explicit = item.get("explicit", False)
             popularity = item.get("popularity", 0)
@@ -205,8 +271,10 @@ class PlaybackMonitor:
             progress_ms = playback.get("progress_ms", 0)
             is_playing = playback.get("is_playing", False)
             
-            timestamp = datetime.utcnow().isoformat()
-            play_id = f"play_{timestamp}_{track_id}"
+            # One clock read per play; epoch ns keeps the play ID filename-safe
+            now_ns = time.time_ns()
+            timestamp = datetime.fromtimestamp(now_ns / 1e9, tz=timezone.utc).isoformat()
+            play_id = f"play_{now_ns}_{track_id}"
             
             # Upsert track
             await self.db.upsert_track(
@@ -222,12 +290,9 @@ class PlaybackMonitor:
             
             # Upsert artists and link to track
             for idx, artist in enumerate(item.get("artists", [])):
-                await self.db.upsert_artist(
-                    artist["id"], artist["name"], artist["uri"]
-                )
-                await self.db.link_track_artist(
-                    track_id, artist["id"], idx
-                )
+                artist_id, artist_name, artist_uri = _get_artist(artist)
+                await self.db.upsert_artist(artist_id, artist_name, artist_uri)
+                await self.db.link_track_artist(track_id, artist_id, idx)
             
             # Upsert context
             if context_uri:
@@ -238,7 +303,7 @@ class PlaybackMonitor:
                 # Try to get playlist name if context is a playlist
                 if context_type == "playlist":
                     playlist_id = context_uri.split(":")[-1]
-                    playlist = self.spotify.get_playlist(playlist_id)
+                    playlist = await self.spotify.get_playlist(playlist_id)
                     if playlist:
                         context_name = playlist.get("name")
                         context_owner = playlist.get("owner", {}).get("id")
@@ -253,12 +318,13 @@ class PlaybackMonitor:
                 play_id, timestamp, track_id, album_id, context_uri,
                 device_id, device_name, device_type, progress_ms, is_playing
             )
-            
+
+            self._logged_plays[track_id] = play_id
             return play_id
             
         except Exception as e:
             logger.error(f"Failed to log play: {e}", exc_info=True)
-            return f"play_{datetime.utcnow().isoformat()}_{item['id']}"
+            return f"play_{time.time_ns()}_{item['id']}"
     
     async def _take_action(self, play_id: str, item: Dict[str, Any],
                           playback: Dict[str, Any], decision: Dict[str, Any]):
@@ -284,7 +350,7 @@ class PlaybackMonitor:
         
         # Auto-skip
         if self.auto_skip:
-            success = self.spotify.skip_to_next()
+            success = await self.spotify.skip_to_next()
             if success:
                 skipped = True
                 logger.info(f"Skipped track: {track_name}")
@@ -296,15 +362,14 @@ class PlaybackMonitor:
             context = playback.get("context")
             if context and context.get("type") == "playlist":
                 playlist_id = context["uri"].split(":")[-1]
-                playlist = self.spotify.get_playlist(playlist_id)
+                playlist = await self.spotify.get_playlist(playlist_id)
                 
                 if playlist:
                     owner_id = playlist.get("owner", {}).get("id")
-                    current_user = self.spotify.sp.current_user()
-                    
+
                     # Only remove from user-owned playlists
-                    if owner_id == current_user["id"]:
-                        success = self.spotify.remove_from_playlist(
+                    if owner_id is not None and owner_id == self._user_id:
+                        success = await self.spotify.remove_from_playlist(
                             playlist_id, item["uri"]
                         )
                         if success:
@@ -315,7 +380,7 @@ class PlaybackMonitor:
         
         # Add to blocked playlist
         if self.blocked_playlist_id:
-            success = self.spotify.add_to_playlist(
+            success = await self.spotify.add_to_playlist(
                 self.blocked_playlist_id, item["uri"]
             )
             if success:
@@ -334,7 +399,6 @@ class PlaybackMonitor:
         
         try:
             # Search for existing playlist
-            user = self.spotify.sp.current_user()
             playlists = self.spotify.sp.current_user_playlists(limit=50)
             
             for playlist in playlists.get("items", []):
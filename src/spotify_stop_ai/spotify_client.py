@@ -1,12 +1,18 @@
 """Spotify API client with PKCE OAuth flow."""
+import asyncio
+import httpx
+import orjson
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 import logging
 import os
+import time
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+API_BASE_URL = "https://api.spotify.com/v1"
+
 
 class SpotifyClient:
     """Spotify API client with OAuth PKCE authentication."""
@@ -34,9 +40,25 @@ class SpotifyClient:
             "playlist-modify-public",
             "user-library-modify"
         ]
-        
+        self._scope_str = " ".join(self.scopes)
+
         self.sp: Optional[spotipy.Spotify] = None
         self.auth_manager: Optional[SpotifyOAuth] = None
+
+        # Shared keep-alive client for the hot read/control paths; the async
+        # monitor calls these without blocking the event loop. spotipy stays
+        # for auth and cold-path calls.
+        self._http: Optional[httpx.AsyncClient] = None
+        self._token_lock = asyncio.Lock()
+
+        # In-memory bearer token with its expiry; avoids spotipy's
+        # cache-file read on every API call
+        self._token: Optional[str] = None
+        self._token_exp = 0.0
+
+        # Last parsed track item; reused across same-track polls
+        self._last_item_id: Optional[str] = None
+        self._last_item: Optional[Dict[str, Any]] = None
     
     def authenticate(self) -> bool:
         """Authenticate with Spotify using PKCE flow.
@@ -48,7 +70,7 @@ class SpotifyClient:
             auth_params = {
                 "client_id": self.client_id,
                 "redirect_uri": self.redirect_uri,
-                "scope": " ".join(self.scopes),
+                "scope": self._scope_str,
                 "cache_path": self.cache_path,
                 "open_browser": True
             }
@@ -60,140 +82,262 @@ class SpotifyClient:
             self.auth_manager = SpotifyOAuth(**auth_params)
             
             self.sp = spotipy.Spotify(auth_manager=self.auth_manager)
-            
+
+            # Widen spotipy's TCP pool, retry transient/429 responses and
+            # accept compressed payloads on the cold-path calls it still owns
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"])
+                )
+            )
+            self.sp._session.mount("https://", adapter)
+            self.sp._session.headers["Accept-Encoding"] = "gzip, br"
+
             # Test authentication with a simple call
             user = self.sp.current_user()
             logger.info(f"Authenticated as Spotify user: {user['display_name']} ({user['id']})")
-            
+
+            self._http = httpx.AsyncClient(
+                base_url=API_BASE_URL,
+                limits=httpx.Limits(
+                    max_keepalive_connections=4,
+                    keepalive_expiry=90.0
+                )
+            )
+
             return True
             
         except Exception as e:
             logger.error(f"Spotify authentication failed: {e}")
             return False
     
-    def get_current_playback(self) -> Optional[Dict[str, Any]]:
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+    async def _auth_header(self) -> Dict[str, str]:
+        """Get a bearer auth header, refreshing the token if needed.
+
+        The token is cached in memory with its expiry so steady-state polls
+        never touch spotipy's cache file; it is refreshed ~60s early.
+
+        Returns:
+            Authorization header dict
+        """
+        if self._token and time.time() < self._token_exp - 60:
+            return {"Authorization": f"Bearer {self._token}"}
+
+        # spotipy's token refresh is sync and not re-entrant; serialize it
+        # and keep it off the event loop
+        async with self._token_lock:
+            # Another task may have refreshed while we waited on the lock
+            if not (self._token and time.time() < self._token_exp - 60):
+                token_info = await asyncio.to_thread(
+                    lambda: self.auth_manager.validate_token(
+                        self.auth_manager.cache_handler.get_cached_token()
+                    )
+                )
+                if token_info:
+                    self._token = token_info["access_token"]
+                    self._token_exp = token_info.get("expires_at", time.time() + 3600)
+                else:
+                    # No cached token yet; run the full auth flow
+                    self._token = await asyncio.to_thread(
+                        self.auth_manager.get_access_token, as_dict=False
+                    )
+                    self._token_exp = time.time() + 3600
+
+        return {"Authorization": f"Bearer {self._token}"}
+
+    async def get_current_playback(self) -> Optional[Dict[str, Any]]:
         """Get current playback state.
-        
+
         Returns:
-            Playback state dict or None if nothing playing
+            Playback state dict, "rate_limited" on 429, or None if nothing
+            playing
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return None
-            
-            playback = self.sp.current_playback()
-            return playback
-            
+
+            response = await self._http.get(
+                "/me/player", headers=await self._auth_header()
+            )
+            if response.status_code == 200:
+                playback = orjson.loads(response.content)
+
+                # On same-track polls, swap in the previously parsed item so
+                # downstream sees one canonical dict per track instead of a
+                # fresh copy every few seconds
+                item = playback.get("item")
+                if item and item.get("type") == "track":
+                    if item.get("id") == self._last_item_id:
+                        playback["item"] = self._last_item
+                    else:
+                        self._last_item_id = item.get("id")
+                        self._last_item = item
+
+                return playback
+            if response.status_code == 204:
+                return None
+            if response.status_code == 429:
+                return "rate_limited"
+
+            logger.error(f"Failed to get current playback: HTTP {response.status_code}")
+            return None
+
         except Exception as e:
             logger.error(f"Failed to get current playback: {e}")
             return None
-    
-    def get_currently_playing(self) -> Optional[Dict[str, Any]]:
+
+    async def get_currently_playing(self) -> Optional[Dict[str, Any]]:
         """Get currently playing track (lighter endpoint).
-        
+
         Returns:
             Currently playing track dict or None
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return None
-            
-            currently_playing = self.sp.currently_playing()
-            return currently_playing
-            
+
+            response = await self._http.get(
+                "/me/player/currently-playing", headers=await self._auth_header()
+            )
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code == 429:
+                return "rate_limited"
+            return None
+
         except Exception as e:
             logger.error(f"Failed to get currently playing: {e}")
             return None
-    
-    def skip_to_next(self) -> bool:
+
+    async def skip_to_next(self) -> bool:
         """Skip to next track.
-        
+
         Returns:
             True if skip successful
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return False
-            
-            self.sp.next_track()
-            logger.info("Skipped to next track")
-            return True
-            
+
+            response = await self._http.post(
+                "/me/player/next", headers=await self._auth_header()
+            )
+            if response.status_code in (200, 204):
+                logger.info("Skipped to next track")
+                return True
+
+            logger.error(f"Failed to skip track: HTTP {response.status_code}")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to skip track: {e}")
             return False
-    
-    def remove_from_playlist(self, playlist_id: str, track_uri: str) -> bool:
+
+    async def remove_from_playlist(self, playlist_id: str, track_uri: str) -> bool:
         """Remove track from playlist.
-        
+
         Args:
             playlist_id: Spotify playlist ID
             track_uri: Spotify track URI
-            
+
         Returns:
             True if removal successful
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return False
-            
-            self.sp.playlist_remove_all_occurrences_of_items(
-                playlist_id, [track_uri]
+
+            response = await self._http.request(
+                "DELETE",
+                f"/playlists/{playlist_id}/tracks",
+                headers=await self._auth_header(),
+                json={"tracks": [{"uri": track_uri}]}
             )
-            logger.info(f"Removed track {track_uri} from playlist {playlist_id}")
-            return True
-            
+            if response.status_code == 200:
+                logger.info(f"Removed track {track_uri} from playlist {playlist_id}")
+                return True
+
+            logger.error(f"Failed to remove track from playlist: HTTP {response.status_code}")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to remove track from playlist: {e}")
             return False
-    
-    def add_to_playlist(self, playlist_id: str, track_uri: str) -> bool:
+
+    async def add_to_playlist(self, playlist_id: str, track_uri: str) -> bool:
         """Add track to playlist.
-        
+
         Args:
             playlist_id: Spotify playlist ID
             track_uri: Spotify track URI
-            
+
         Returns:
             True if addition successful
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return False
-            
-            self.sp.playlist_add_items(playlist_id, [track_uri])
-            logger.info(f"Added track {track_uri} to playlist {playlist_id}")
-            return True
-            
+
+            response = await self._http.post(
+                f"/playlists/{playlist_id}/tracks",
+                headers=await self._auth_header(),
+                json={"uris": [track_uri]}
+            )
+            if response.status_code in (200, 201):
+                logger.info(f"Added track {track_uri} to playlist {playlist_id}")
+                return True
+
+            logger.error(f"Failed to add track to playlist: HTTP {response.status_code}")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to add track to playlist: {e}")
             return False
-    
-    def get_playlist(self, playlist_id: str) -> Optional[Dict[str, Any]]:
+
+    async def get_playlist(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         """Get playlist details.
-        
+
         Args:
             playlist_id: Spotify playlist ID
-            
+
         Returns:
             Playlist dict or None
         """
         try:
-            if not self.sp:
+            if not self._http:
                 logger.error("Spotify client not authenticated")
                 return None
-            
-            playlist = self.sp.playlist(playlist_id)
-            return playlist
-            
+
+            response = await self._http.get(
+                f"/playlists/{playlist_id}", headers=await self._auth_header()
+            )
+            if response.status_code == 200:
+                return response.json()
+
+            # Some playlists (like algorithmic mixes, radio stations) may not
+            # be publicly accessible. This is expected behavior, not an error
+            logger.debug(f"Could not fetch playlist {playlist_id}: HTTP {response.status_code}")
+            return None
+
         except Exception as e:
-            # Some playlists (like algorithmic mixes, radio stations) may not be publicly accessible
-            # This is expected behavior, not an error
             logger.debug(f"Could not fetch playlist {playlist_id}: {e}")
             return None
     
@@ -1,13 +1,80 @@
 """Web UI for monitoring and managing Spotify Stop AI."""
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+import asyncio
+import base64
+import orjson
+import time
+from fastapi import BackgroundTasks, FastAPI, Request, Form, Response
+from fastapi.responses import (
+    HTMLResponse, ORJSONResponse, RedirectResponse, StreamingResponse
+)
 from fastapi.templating import Jinja2Templates
-from typing import Optional
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from pydantic import BeforeValidator
+from typing import Annotated, Optional
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Template machinery is process-wide state: resolve the directory and build
+# the Environment once at import rather than on every create_web_ui call
+# (which runs per worker). Compile templates once and keep them: no
+# per-request stat() checks (auto_reload), unbounded template cache, and
+# compiled bytecode reused across restarts from a cache directory next to
+# the templates, where it survives temp-dir cleanup
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+_TEMPLATES_DIR.mkdir(exist_ok=True)
+_BYTECODE_DIR = _TEMPLATES_DIR / ".jinja_cache"
+_BYTECODE_DIR.mkdir(exist_ok=True)
+_env = Environment(
+    loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(directory=str(_BYTECODE_DIR)),
+    autoescape=True
+)
+_templates = Jinja2Templates(env=_env)
+
+# Pre-encoded /api/current body for before the monitor has seen any track
+_EMPTY_CURRENT = orjson.dumps({"current_track": None, "last_decision": None})
+
+
+def _parse_bool(value):
+    """Coerce form/query booleans once at the edge.
+
+    One shared validator instead of pydantic's per-field bool parsing;
+    empty values map to None so optional filters fall through cleanly.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "on", "yes")
+
+
+# Optional query/form boolean; absent or empty means "no filter"
+BoolParam = Annotated[Optional[bool], BeforeValidator(_parse_bool)]
+# Required form boolean; empty input still fails validation
+BoolForm = Annotated[bool, BeforeValidator(_parse_bool)]
+
+
+def _encode_cursor(timestamp: str, row_id: str) -> str:
+    """Pack a (timestamp, id) keyset cursor into a URL-safe token."""
+    return base64.urlsafe_b64encode(f"{timestamp}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: Optional[str]) -> tuple:
+    """Unpack a keyset cursor; malformed tokens fall back to the first page."""
+    if not cursor:
+        return None, None
+    try:
+        timestamp, _, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        if row_id:
+            return timestamp, row_id
+    except Exception:
+        pass
+    return None, None
+
 
 def create_web_ui(database, classifier, spotify_client, monitor):
     """Create web UI app.
@@ -21,143 +88,213 @@ def create_web_ui(database, classifier, spotify_client, monitor):
     Returns:
         FastAPI app
     """
-    app = FastAPI(title="Spotify Stop AI - Web UI")
-    
-    # Setup templates
-    templates_dir = Path(__file__).parent / "templates"
-    templates_dir.mkdir(exist_ok=True)
-    templates = Jinja2Templates(directory=str(templates_dir))
-    
+    app = FastAPI(title="Spotify Stop AI - Web UI",
+                  default_response_class=ORJSONResponse)
+
+    templates = _templates
+
+    # Short-TTL cache of rendered listing pages. Play/decision data changes
+    # at most once per poll interval, so repeated views inside the window
+    # skip the queries and template render entirely. Keyed on the query
+    # params and capped so arbitrary cursors can't grow it unbounded
+    page_cache: dict = {}
+    page_cache_max = 128
+
+    def cached_page(key: tuple, ttl: float) -> Optional[bytes]:
+        entry = page_cache.get(key)
+        if entry and (time.monotonic() - entry[0]) < ttl:
+            return entry[1]
+        return None
+
+    def store_page(key: tuple, body: bytes) -> None:
+        if len(page_cache) >= page_cache_max:
+            # Evict the oldest entry (dicts preserve insertion order)
+            page_cache.pop(next(iter(page_cache)))
+        page_cache[key] = (time.monotonic(), body)
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        """Close pooled HTTP connections held by the LLM client."""
+        if getattr(classifier, "ollama_client", None):
+            await classifier.ollama_client.aclose()
+
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request):
         """Home page with current playback."""
         current_track = monitor.current_track
-        
-        # Get detailed classification for current artist if available
-        current_artist_details = None
-        if current_track and current_track.get('artist_id'):
+
+        async def current_artist_details_task():
+            """Get detailed classification for current artist if available."""
+            if not (current_track and current_track.get('artist_id')):
+                return None
+
             artist_id = current_track['artist_id']
             decisions_with_sources = await database.get_decisions_with_sources(artist_id)
-            if decisions_with_sources:
-                # Get the most recent decision
-                decision = decisions_with_sources[0]
-                
-                # Check for override
-                override = await database.get_override(artist_id)
-                if override:
-                    decision['is_artificial'] = override['is_artificial']
-                    decision['overridden'] = True
-                    decision['override_reason'] = override.get('reason', '')
-                else:
-                    decision['overridden'] = False
-                
-                current_artist_details = decision
-        
-        # Get recent plays
-        plays = await database.get_plays(limit=10)
-        
-        # Get recent decisions with contexts
-        decisions_raw = await database.get_decisions(limit=10)
-        
-        # Enrich decisions with context counts and overrides
-        decisions = []
-        for decision in decisions_raw:
-            # Get context count for this decision
-            context_count = await database.get_decision_context_count(decision['id'])
-            decision['context_count'] = context_count
-            
-            # Check for override - if exists, it takes precedence
-            override = await database.get_override(decision['artist_id'])
+            if not decisions_with_sources:
+                return None
+
+            # Get the most recent decision
+            decision = decisions_with_sources[0]
+
+            # Check for override
+            override = await database.get_override(artist_id)
             if override:
                 decision['is_artificial'] = override['is_artificial']
                 decision['overridden'] = True
+                decision['override_reason'] = override.get('reason', '')
             else:
                 decision['overridden'] = False
-            
-            decisions.append(decision)
-        
-        return templates.TemplateResponse("index.html", {
+
+            return decision
+
+        async def decisions_task():
+            """Fetch recent decisions and enrich them in one pipeline.
+
+            The batched override query fires the moment the decisions
+            land, overlapping with the plays fetch instead of waiting for
+            the whole first gather to settle. context_count is already on
+            each row, maintained by triggers on the sources table.
+            """
+            decisions = await database.get_decisions(limit=10)
+
+            # One batched query instead of a round-trip per decision
+            overrides = await database.get_overrides_for_artists(
+                [d['artist_id'] for d in decisions])
+            for decision in decisions:
+                # Check for override - if exists, it takes precedence
+                override = overrides.get(decision['artist_id'])
+                if override:
+                    decision['is_artificial'] = override['is_artificial']
+                    decision['overridden'] = True
+                else:
+                    decision['overridden'] = False
+            return decisions
+
+        # Fire the independent pipelines concurrently
+        current_artist_details, plays, decisions = await asyncio.gather(
+            current_artist_details_task(),
+            database.get_plays(limit=10),
+            decisions_task()
+        )
+
+
+        return templates.TemplateResponse(request, "index.html", {
             "request": request,
             "current_track": current_track,
             "current_artist_details": current_artist_details,
             "plays": plays,
             "decisions": decisions
-        })
+        }, headers={"Cache-Control": "private, max-age=2"})
     
     @app.get("/plays", response_class=HTMLResponse)
     async def plays_page(
         request: Request,
-        page: int = 1,
+        cursor: Optional[str] = None,
         search: Optional[str] = None
     ):
-        """Browse all plays."""
+        """Browse all plays.
+
+        Pages are keyset-paginated: the cursor carries the last row's
+        (timestamp, id) so every page is a seek, not an OFFSET scan.
+        """
         limit = 50
-        offset = (page - 1) * limit
-        
+        before_ts, before_id = _decode_cursor(cursor)
+
+        # Searches are less latency-critical, so they may stay cached longer
+        cache_key = ("plays", cursor, search)
+        cached = cached_page(cache_key, ttl=10.0 if search else 2.0)
+        if cached is not None:
+            return HTMLResponse(cached)
+
         if search:
             # Search by artist or track name
-            plays = await database.search_plays(search, limit, offset)
+            plays = await database.search_plays(
+                search, limit, before_ts=before_ts, before_id=before_id)
         else:
-            plays = await database.get_plays(limit=limit, offset=offset)
-        
-        return templates.TemplateResponse("plays.html", {
+            plays = await database.get_plays(
+                limit=limit, before_ts=before_ts, before_id=before_id)
+
+        next_cursor = (
+            _encode_cursor(plays[-1]['timestamp'], plays[-1]['id'])
+            if len(plays) == limit else None
+        )
+
+        response = templates.TemplateResponse(request, "plays.html", {
             "request": request,
             "plays": plays,
-            "page": page,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
             "search": search
         })
+        store_page(cache_key, response.body)
+        return response
     
     @app.get("/decisions", response_class=HTMLResponse)
     async def decisions_page(
         request: Request,
-        page: int = 1,
-        filter_artificial: Optional[bool] = None
+        cursor: Optional[str] = None,
+        filter_artificial: BoolParam = None
     ):
-        """Browse all decisions."""
+        """Browse all decisions, keyset-paginated like /plays."""
         limit = 50
-        offset = (page - 1) * limit
-        
+        before_ts, before_id = _decode_cursor(cursor)
+
+        cache_key = ("decisions", cursor, filter_artificial)
+        cached = cached_page(cache_key, ttl=2.0)
+        if cached is not None:
+            return HTMLResponse(cached)
+
         if filter_artificial is not None:
-            decisions = await database.get_decisions_filtered(filter_artificial, limit, offset)
+            # Bind as int to match the stored INTEGER column directly
+            decisions = await database.get_decisions_filtered(
+                int(filter_artificial), limit, before_ts=before_ts, before_id=before_id)
         else:
-            decisions = await database.get_decisions(limit=limit, offset=offset)
-        
-        return templates.TemplateResponse("decisions.html", {
+            decisions = await database.get_decisions(
+                limit=limit, before_ts=before_ts, before_id=before_id)
+
+        next_cursor = (
+            _encode_cursor(decisions[-1]['timestamp'], decisions[-1]['id'])
+            if len(decisions) == limit else None
+        )
+
+        response = templates.TemplateResponse(request, "decisions.html", {
             "request": request,
             "decisions": decisions,
-            "page": page,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
             "filter_artificial": filter_artificial
         })
+        store_page(cache_key, response.body)
+        return response
     
     @app.get("/artist/{artist_id}", response_class=HTMLResponse)
     async def artist_detail(request: Request, artist_id: str):
         """Artist detail page with all classifications."""
-        # Get artist
-        artist = await database.get_artist(artist_id)
+        # One batched fetch on a single reader connection instead of four
+        # separate pool checkouts; the queries are small point lookups, so
+        # the round trips dominated, not the query time
+        artist, decisions, override, plays = await database.get_artist_detail(artist_id)
         if not artist:
             return HTMLResponse("Artist not found", status_code=404)
-        
-        # Get all decisions with sources
-        decisions = await database.get_decisions_with_sources(artist_id)
-        
-        # Get override
-        override = await database.get_override(artist_id)
-        
-        # Get plays for this artist
-        plays = await database.get_plays_for_artist(artist_id)
-        
-        return templates.TemplateResponse("artist.html", {
+
+        # Heavily-classified artists render a long decisions list; stream
+        # the template so the first bytes flush before the whole page is
+        # rendered. Buffering batches Jinja's many small chunks into
+        # reasonably sized writes
+        stream = _env.get_template("artist.html").stream({
             "request": request,
             "artist": artist,
             "decisions": decisions,
             "override": override,
             "plays": plays
         })
+        stream.enable_buffering(32)
+        return StreamingResponse(stream, media_type="text/html")
     
     @app.post("/override/{artist_id}")
     async def set_override_form(
         artist_id: str,
-        is_artificial: bool = Form(...),
+        is_artificial: BoolForm = Form(...),
         reason: str = Form(None)
     ):
         """Set override from form."""
@@ -171,21 +308,44 @@ def create_web_ui(database, classifier, spotify_client, monitor):
         return RedirectResponse(f"/artist/{artist_id}", status_code=303)
     
     @app.post("/reclassify/{artist_id}")
-    async def reclassify_form(artist_id: str, artist_name: str = Form(...)):
-        """Reclassify artist from form - forces fresh classification."""
-        # Invalidate cache to force fresh classification
-        await database.invalidate_cache(artist_id)
-        # Run classification
-        await classifier.classify_artist(artist_id, artist_name)
+    async def reclassify_form(
+        artist_id: str,
+        background: BackgroundTasks,
+        artist_name: str = Form(...)
+    ):
+        """Reclassify artist from form - forces fresh classification.
+
+        Classification fans out to the data sources (and possibly the
+        LLM), which can take many seconds; run it after the redirect is
+        sent instead of making the browser wait on it. The artist page
+        shows the previous decision until the new one lands.
+        """
+        async def reclassify():
+            # Invalidate cache to force fresh classification
+            await database.invalidate_cache(artist_id)
+            await classifier.classify_artist(artist_id, artist_name)
+
+        background.add_task(reclassify)
         return RedirectResponse(f"/artist/{artist_id}", status_code=303)
     
     @app.get("/api/current")
-    async def current_playback_api():
+    async def current_playback_api(request: Request):
         """Get current playback state (for auto-refresh)."""
-        return {
-            "current_track": monitor.current_track,
-            "last_decision": monitor.last_decision if hasattr(monitor, 'last_decision') else None
-        }
+        body = monitor.current_cached_bytes
+        if body is None:
+            return Response(content=_EMPTY_CURRENT, media_type="application/json")
+
+        # The monitor pre-encodes the payload; serve the bytes directly and
+        # let polling clients revalidate with the ETag
+        etag = monitor.current_etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": "no-cache"}
+        )
     
     return app
 
@@ -206,4 +366,5 @@ def run_web_ui(database, classifier, spotify_client, monitor,
     
     app = create_web_ui(database, classifier, spotify_client, monitor)
     logger.info(f"Starting web UI at http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    uvicorn.run(app, host=host, port=port, log_level="info",
+                loop="uvloop", http="httptools", access_log=False)